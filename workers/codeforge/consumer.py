@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import signal
 from typing import TYPE_CHECKING
 
@@ -12,12 +13,14 @@ import structlog
 from codeforge.config import WorkerSettings
 from codeforge.executor import AgentExecutor
 from codeforge.llm import LiteLLMClient
-from codeforge.logger import setup_logging
+from codeforge.logger import setup_logging, shutdown_logging
 from codeforge.models import QualityGateRequest, QualityGateResult, RunStartMessage, TaskMessage, TaskResult
 from codeforge.qualitygate import QualityGateExecutor
 from codeforge.runtime import RuntimeClient
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from nats.aio.client import Client as NATSClient
     from nats.js.client import JetStreamContext
 
@@ -122,9 +125,7 @@ class TaskConsumer:
     async def _handle_message(self, msg: nats.aio.msg.Msg) -> None:
         """Process a single task message: parse, execute, ack/nack."""
         # Extract request ID from NATS headers for log correlation
-        request_id = ""
-        if msg.headers and HEADER_REQUEST_ID in msg.headers:
-            request_id = msg.headers[HEADER_REQUEST_ID]
+        request_id = msg.headers.get(HEADER_REQUEST_ID, "") if msg.headers else ""
 
         log = logger.bind(request_id=request_id) if request_id else logger
 
@@ -133,10 +134,19 @@ class TaskConsumer:
             log = log.bind(task_id=task.id)
             log.info("received task", title=task.title)
 
-            # Send running status update
-            await self._publish_output(task.id, f"Starting task: {task.title}", "stdout", request_id)
-
-            result: TaskResult = await self._executor.execute(task)
+            # Send running status update while the task executes; it only
+            # has to be acknowledged before the result is published. The line
+            # is advisory, so a failed publish must not discard the result.
+            started = asyncio.create_task(
+                self._publish_output(task.id, f"Starting task: {task.title}", "stdout", request_id),
+            )
+            try:
+                result: TaskResult = await self._executor.execute(task)
+            finally:
+                try:
+                    await started
+                except Exception:
+                    log.exception("failed to publish task start output")
 
             # Publish result back
             if self._js is not None:
@@ -179,10 +189,9 @@ class TaskConsumer:
             # Enrich prompt with pre-packed context entries (Phase 5D)
             enriched_prompt = run_msg.prompt
             if run_msg.context:
-                context_section = "\n\n--- Relevant Context ---\n"
-                for entry in run_msg.context:
-                    context_section += f"\n### {entry.kind}: {entry.path}\n{entry.content}\n"
-                enriched_prompt = run_msg.prompt + context_section
+                parts = [run_msg.prompt, "\n\n--- Relevant Context ---\n"]
+                parts.extend(f"\n### {entry.kind}: {entry.path}\n{entry.content}\n" for entry in run_msg.context)
+                enriched_prompt = "".join(parts)
                 log.info("context injected", entries=len(run_msg.context))
 
             # Convert to TaskMessage for executor compatibility
@@ -265,15 +274,12 @@ class TaskConsumer:
         """Publish a streaming output line for a task."""
         if self._js is None:
             return
-        import json
 
         payload = json.dumps({"task_id": task_id, "line": line, "stream": stream})
 
-        headers = {}
-        if request_id:
-            headers[HEADER_REQUEST_ID] = request_id
+        headers = {HEADER_REQUEST_ID: request_id} if request_id else None
 
-        await self._js.publish(SUBJECT_OUTPUT, payload.encode(), headers=headers if headers else None)
+        await self._js.publish(SUBJECT_OUTPUT, payload.encode(), headers=headers)
 
     async def stop(self) -> None:
         """Gracefully shut down: drain with timeout and close."""
@@ -310,5 +316,17 @@ async def main() -> None:
     await consumer.start()
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory if it is installed, else the asyncio default."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main(), loop_factory=_loop_factory())
+    finally:
+        shutdown_logging()
@@ -20,12 +20,22 @@ class CompletionResponse:
 class LiteLLMClient:
     """HTTP client for the LiteLLM Proxy (OpenAI-compatible API)."""
 
-    def __init__(self, base_url: str = "http://localhost:4000", api_key: str = "") -> None:
+    def __init__(
+        self,
+        base_url: str = "http://localhost:4000",
+        api_key: str = "",
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._base_url = base_url.rstrip("/")
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
-        self._client = httpx.AsyncClient(base_url=self._base_url, headers=headers, timeout=120.0)
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=headers,
+            timeout=120.0,
+            transport=transport,
+        )
 
     async def completion(
         self,
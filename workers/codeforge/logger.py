@@ -7,41 +7,71 @@ Log schema aligns with Go Core:
 from __future__ import annotations
 
 import logging
+import logging.handlers
+import queue
 import sys
 
 import structlog
 
+_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging(service: str = "codeforge-worker", level: str = "info") -> None:
     """Configure structlog with JSON output matching the Go Core schema.
 
     Must be called once at application startup before any logging.
+
+    Entries are rendered to JSON on the calling thread, then handed to a queue
+    and written to stdout by a background listener thread, so the event loop
+    never blocks on stdout.
     """
+    global _listener
+
     log_level = getattr(logging, level.upper(), logging.INFO)
 
-    # Configure stdlib logging to route through structlog
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=log_level,
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    shared_processors: list[structlog.types.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+        _add_service(service),
+    ]
+
+    # Render on the calling thread: QueueHandler.prepare() formats the record
+    # and drops exc_info, so only a finished JSON line crosses the queue.
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=shared_processors,
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(),
+            ],
+        ),
     )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    shutdown_logging()
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+    # Stdlib loggers (e.g. codeforge.executor) share the same JSON output
+    logging.basicConfig(handlers=[queue_handler], level=log_level, force=True)
 
     structlog.configure(
         processors=[
-            structlog.contextvars.merge_contextvars,
             structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            _add_service(service),
-            structlog.processors.JSONRenderer(),
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
@@ -58,3 +88,15 @@ def _add_service(service: str) -> structlog.types.Processor:
         return event_dict
 
     return processor
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background listener.
+
+    Safe to call when logging was never set up or was already shut down.
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -7,6 +7,7 @@ commands in the project workspace, and reports results back.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 
 import structlog
 
@@ -15,13 +16,25 @@ from codeforge.models import QualityGateRequest, QualityGateResult
 logger = structlog.get_logger()
 
 DEFAULT_TIMEOUT_SECONDS = 120
+DEFAULT_MAX_OUTPUT_BYTES = 64 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+TRUNCATION_MARKER = b"\n\n... output truncated ...\n\n"
+MIN_MAX_OUTPUT_BYTES = 2 * len(TRUNCATION_MARKER)
 
 
 class QualityGateExecutor:
     """Executes test and lint commands and returns pass/fail results."""
 
-    def __init__(self, timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    ) -> None:
+        if max_output_bytes < MIN_MAX_OUTPUT_BYTES:
+            msg = f"max_output_bytes must be at least {MIN_MAX_OUTPUT_BYTES}, got {max_output_bytes}"
+            raise ValueError(msg)
         self._timeout = timeout_seconds
+        self._max_output = max_output_bytes
 
     async def execute(self, request: QualityGateRequest) -> QualityGateResult:
         """Run the requested quality gate checks and return the result."""
@@ -70,8 +83,8 @@ class QualityGateExecutor:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
             )
-            stdout, _ = await asyncio.wait_for(
-                proc.communicate(),
+            stdout = await asyncio.wait_for(
+                self._read_output(proc),
                 timeout=self._timeout,
             )
             output = stdout.decode(errors="replace") if stdout else ""
@@ -89,3 +102,47 @@ class QualityGateExecutor:
         except Exception as exc:
             log.error("gate command error", command=command, error=str(exc))
             return False, str(exc)
+
+    async def _read_output(self, proc: asyncio.subprocess.Process) -> bytes:
+        """Drain the process output and wait for it to exit."""
+        output = await _read_bounded(proc.stdout, self._max_output) if proc.stdout else b""
+        await proc.wait()
+        return output
+
+
+async def _read_bounded(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a stream to EOF, keeping at most ``limit`` bytes of head and tail.
+
+    Middle chunks are discarded as they arrive, so memory stays bounded no
+    matter how much the command prints. A marker is inserted where bytes
+    were dropped. The tail gets the extra byte of an odd ``limit``.
+    """
+    head_limit = limit // 2
+    tail_limit = limit - head_limit
+    head = bytearray()
+    tail: deque[bytes] = deque()
+    tail_size = 0
+    dropped = False
+
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        if len(head) < head_limit:
+            take = head_limit - len(head)
+            head += chunk[:take]
+            chunk = chunk[take:]
+            if not chunk:
+                continue
+        tail.append(chunk)
+        tail_size += len(chunk)
+        while len(tail) > 1 and tail_size - len(tail[0]) >= tail_limit:
+            tail_size -= len(tail.popleft())
+            dropped = True
+
+    tail_bytes = b"".join(tail)
+    if tail_size > tail_limit:
+        # Slice from the front: a negative index of -0 would keep everything.
+        tail_bytes = tail_bytes[tail_size - tail_limit :]
+        dropped = True
+
+    if dropped:
+        return bytes(head) + TRUNCATION_MARKER + tail_bytes
+    return bytes(head) + tail_bytes
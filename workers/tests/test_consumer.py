@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,6 +12,22 @@ from codeforge.consumer import TaskConsumer
 from codeforge.models import ContextEntry, RunStartMessage, TaskMessage, TaskResult, TaskStatus
 
 
+def _task_payload(task_id: str, title: str, prompt: str) -> bytes:
+    """Serialize a TaskMessage the way Go Core publishes it."""
+    return TaskMessage(id=task_id, project_id="proj-1", title=title, prompt=prompt).model_dump_json().encode()
+
+
+# Task payloads are constant, so serialize them once at import.
+_TASK_SUCCESS = _task_payload("task-1", "Test task", "Do something")
+_TASK_FAILING = _task_payload("task-2", "Failing task", "This will fail")
+_TASK_REQUEST_ID = _task_payload("task-3", "ID test", "Check request ID")
+
+
+def _make_msg(data: bytes, headers: dict[str, str] | None = None) -> SimpleNamespace:
+    """Create a lightweight stand-in for a NATS message with awaitable ack/nak."""
+    return SimpleNamespace(data=data, headers=headers, ack=AsyncMock(), nak=AsyncMock())
+
+
 @pytest.fixture
 def consumer() -> TaskConsumer:
     """Create a TaskConsumer for testing."""
@@ -18,18 +36,7 @@ def consumer() -> TaskConsumer:
 
 async def test_handle_message_success(consumer: TaskConsumer) -> None:
     """_handle_message should parse, execute, publish result, and ack."""
-    task_json = TaskMessage(
-        id="task-1",
-        project_id="proj-1",
-        title="Test task",
-        prompt="Do something",
-    ).model_dump_json()
-
-    msg = MagicMock()
-    msg.data = task_json.encode()
-    msg.headers = {"X-Request-ID": "req-abc-123"}
-    msg.ack = AsyncMock()
-    msg.nak = AsyncMock()
+    msg = _make_msg(_TASK_SUCCESS, headers={"X-Request-ID": "req-abc-123"})
 
     expected_result = TaskResult(
         task_id="task-1",
@@ -53,13 +60,56 @@ async def test_handle_message_success(consumer: TaskConsumer) -> None:
     msg.nak.assert_not_called()
 
 
+async def test_handle_message_output_overlaps_execution(consumer: TaskConsumer) -> None:
+    """_handle_message should publish the start line while the task executes, before the result."""
+    published_during_execution: list[str] = []
+
+    async def _execute(_task: TaskMessage) -> TaskResult:
+        await asyncio.sleep(0)
+        published_during_execution.extend(call.args[0] for call in consumer._js.publish.call_args_list)
+        return TaskResult(task_id="task-1", status=TaskStatus.COMPLETED, output="Done")
+
+    msg = _make_msg(_TASK_SUCCESS)
+
+    consumer._js = AsyncMock()
+    consumer._executor = MagicMock()
+    consumer._executor.execute = _execute
+
+    await consumer._handle_message(msg)
+
+    assert published_during_execution == ["tasks.output"]
+    subjects = [call.args[0] for call in consumer._js.publish.call_args_list]
+    assert subjects == ["tasks.output", "tasks.result"]
+    msg.ack.assert_called_once()
+
+
+async def test_handle_message_start_publish_failure_keeps_result(consumer: TaskConsumer) -> None:
+    """_handle_message should still publish the result and ack when the start line publish fails."""
+
+    async def _publish(subject: str, *_args: object, **_kwargs: object) -> None:
+        if subject == "tasks.output":
+            raise ConnectionError("publish failed")
+
+    msg = _make_msg(_TASK_SUCCESS)
+    result = TaskResult(task_id="task-1", status=TaskStatus.COMPLETED, output="Done")
+
+    consumer._js = AsyncMock()
+    consumer._js.publish.side_effect = _publish
+    consumer._executor = MagicMock()
+    consumer._executor.execute = AsyncMock(return_value=result)
+
+    await consumer._handle_message(msg)
+
+    consumer._executor.execute.assert_called_once()
+    subjects = [call.args[0] for call in consumer._js.publish.call_args_list]
+    assert subjects == ["tasks.output", "tasks.result"]
+    msg.ack.assert_called_once()
+    msg.nak.assert_not_called()
+
+
 async def test_handle_message_invalid_json(consumer: TaskConsumer) -> None:
     """_handle_message should nack on invalid JSON."""
-    msg = MagicMock()
-    msg.data = b"not valid json"
-    msg.headers = None
-    msg.ack = AsyncMock()
-    msg.nak = AsyncMock()
+    msg = _make_msg(b"not valid json")
 
     consumer._js = AsyncMock()
 
@@ -71,18 +121,7 @@ async def test_handle_message_invalid_json(consumer: TaskConsumer) -> None:
 
 async def test_handle_message_executor_failure(consumer: TaskConsumer) -> None:
     """_handle_message should still ack after executor returns a FAILED result."""
-    task_json = TaskMessage(
-        id="task-2",
-        project_id="proj-1",
-        title="Failing task",
-        prompt="This will fail",
-    ).model_dump_json()
-
-    msg = MagicMock()
-    msg.data = task_json.encode()
-    msg.headers = None
-    msg.ack = AsyncMock()
-    msg.nak = AsyncMock()
+    msg = _make_msg(_TASK_FAILING)
 
     failed_result = TaskResult(
         task_id="task-2",
@@ -102,18 +141,7 @@ async def test_handle_message_executor_failure(consumer: TaskConsumer) -> None:
 
 async def test_handle_message_request_id_propagated(consumer: TaskConsumer) -> None:
     """_handle_message should propagate request_id from NATS headers to output publishes."""
-    task_json = TaskMessage(
-        id="task-3",
-        project_id="proj-1",
-        title="ID test",
-        prompt="Check request ID",
-    ).model_dump_json()
-
-    msg = MagicMock()
-    msg.data = task_json.encode()
-    msg.headers = {"X-Request-ID": "req-propagated-456"}
-    msg.ack = AsyncMock()
-    msg.nak = AsyncMock()
+    msg = _make_msg(_TASK_REQUEST_ID, headers={"X-Request-ID": "req-propagated-456"})
 
     result = TaskResult(task_id="task-3", status=TaskStatus.COMPLETED, output="OK")
 
@@ -141,11 +169,7 @@ async def test_handle_run_start_with_context(consumer: TaskConsumer) -> None:
             ContextEntry(kind="shared", path="", content="step-1 completed OK", tokens=5, priority=90),
         ],
     )
-    msg = MagicMock()
-    msg.data = run_msg.model_dump_json().encode()
-    msg.headers = None
-    msg.ack = AsyncMock()
-    msg.nak = AsyncMock()
+    msg = _make_msg(run_msg.model_dump_json().encode())
 
     consumer._js = AsyncMock()
     consumer._executor = MagicMock()
@@ -156,10 +180,12 @@ async def test_handle_run_start_with_context(consumer: TaskConsumer) -> None:
     # Verify executor was called with enriched prompt
     call_args = consumer._executor.execute_with_runtime.call_args
     task_arg = call_args.args[0]
-    assert "--- Relevant Context ---" in task_arg.prompt
-    assert "src/auth.py" in task_arg.prompt
-    assert "def login(): pass" in task_arg.prompt
-    assert "step-1 completed OK" in task_arg.prompt
+    assert task_arg.prompt == (
+        "Fix the login bug"
+        "\n\n--- Relevant Context ---\n"
+        "\n### file: src/auth.py\ndef login(): pass\n"
+        "\n### shared: \nstep-1 completed OK\n"
+    )
     msg.ack.assert_called_once()
 
 
@@ -172,11 +198,7 @@ async def test_handle_run_start_without_context(consumer: TaskConsumer) -> None:
         agent_id="agent-1",
         prompt="Refactor utils module",
     )
-    msg = MagicMock()
-    msg.data = run_msg.model_dump_json().encode()
-    msg.headers = None
-    msg.ack = AsyncMock()
-    msg.nak = AsyncMock()
+    msg = _make_msg(run_msg.model_dump_json().encode())
 
     consumer._js = AsyncMock()
     consumer._executor = MagicMock()
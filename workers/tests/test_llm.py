@@ -2,35 +2,51 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import json
 
 import httpx
 import pytest
 
 from codeforge.llm import LiteLLMClient
 
-_FAKE_REQUEST = httpx.Request("POST", "http://test:4000/v1/chat/completions")
+
+@pytest.fixture
+def routes() -> dict[str, httpx.Response | Exception]:
+    """Responses served by the mock transport, keyed by request path."""
+    return {}
 
 
 @pytest.fixture
-def client() -> LiteLLMClient:
-    """Create a LiteLLMClient for testing."""
-    return LiteLLMClient(base_url="http://test:4000", api_key="test-key")
+def sent() -> list[httpx.Request]:
+    """Requests received by the mock transport, in order."""
+    return []
+
+
+@pytest.fixture
+def client(routes: dict[str, httpx.Response | Exception], sent: list[httpx.Request]) -> LiteLLMClient:
+    """Create a LiteLLMClient backed by an in-memory transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        route = routes[request.url.path]
+        if isinstance(route, Exception):
+            raise route
+        return route
+
+    return LiteLLMClient(base_url="http://test:4000", api_key="test-key", transport=httpx.MockTransport(handler))
 
 
-async def test_completion_parses_response(client: LiteLLMClient) -> None:
+async def test_completion_parses_response(client: LiteLLMClient, routes: dict[str, httpx.Response | Exception]) -> None:
     """completion() should parse a valid OpenAI-format response."""
-    mock_response = httpx.Response(
+    routes["/v1/chat/completions"] = httpx.Response(
         200,
         json={
             "choices": [{"message": {"content": "Hello world"}}],
             "usage": {"prompt_tokens": 10, "completion_tokens": 5},
         },
-        request=_FAKE_REQUEST,
     )
 
-    with patch.object(client._client, "post", new_callable=AsyncMock, return_value=mock_response):
-        result = await client.completion(prompt="Say hello", model="test-model")
+    result = await client.completion(prompt="Say hello", model="test-model")
 
     assert result.content == "Hello world"
     assert result.tokens_in == 10
@@ -38,34 +54,59 @@ async def test_completion_parses_response(client: LiteLLMClient) -> None:
     assert result.model == "test-model"
 
 
-async def test_completion_empty_choices(client: LiteLLMClient) -> None:
+async def test_completion_sends_request(
+    client: LiteLLMClient,
+    routes: dict[str, httpx.Response | Exception],
+    sent: list[httpx.Request],
+) -> None:
+    """completion() should POST the chat payload with the API key."""
+    routes["/v1/chat/completions"] = httpx.Response(200, json={"choices": [], "usage": {}})
+
+    await client.completion(prompt="Say hello", model="test-model", system="Be brief", temperature=0.5)
+
+    assert len(sent) == 1
+    request = sent[0]
+    assert request.method == "POST"
+    assert request.headers["Authorization"] == "Bearer test-key"
+    assert json.loads(request.content) == {
+        "model": "test-model",
+        "messages": [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": "Say hello"},
+        ],
+        "temperature": 0.5,
+    }
+
+
+async def test_completion_empty_choices(client: LiteLLMClient, routes: dict[str, httpx.Response | Exception]) -> None:
     """completion() should handle empty choices gracefully."""
-    mock_response = httpx.Response(200, json={"choices": [], "usage": {}}, request=_FAKE_REQUEST)
+    routes["/v1/chat/completions"] = httpx.Response(200, json={"choices": [], "usage": {}})
 
-    with patch.object(client._client, "post", new_callable=AsyncMock, return_value=mock_response):
-        result = await client.completion(prompt="test")
+    result = await client.completion(prompt="test")
 
     assert result.content == ""
     assert result.tokens_in == 0
     assert result.tokens_out == 0
 
 
-async def test_health_returns_true(client: LiteLLMClient) -> None:
+async def test_health_returns_true(client: LiteLLMClient, routes: dict[str, httpx.Response | Exception]) -> None:
     """health() should return True when the proxy responds with 200."""
-    mock_response = httpx.Response(200, request=httpx.Request("GET", "http://test:4000/health"))
+    routes["/health"] = httpx.Response(200)
 
-    with patch.object(client._client, "get", new_callable=AsyncMock, return_value=mock_response):
-        assert await client.health() is True
+    assert await client.health() is True
 
 
-async def test_health_returns_false_on_error(client: LiteLLMClient) -> None:
+async def test_health_returns_false_on_error(
+    client: LiteLLMClient, routes: dict[str, httpx.Response | Exception]
+) -> None:
     """health() should return False on connection errors."""
-    with patch.object(client._client, "get", new_callable=AsyncMock, side_effect=httpx.ConnectError("refused")):
-        assert await client.health() is False
+    routes["/health"] = httpx.ConnectError("refused")
+
+    assert await client.health() is False
 
 
-async def test_close_calls_aclose(client: LiteLLMClient) -> None:
+async def test_close_closes_http_client(client: LiteLLMClient) -> None:
     """close() should properly close the HTTP client."""
-    with patch.object(client._client, "aclose", new_callable=AsyncMock) as mock_close:
-        await client.close()
-        mock_close.assert_called_once()
+    await client.close()
+
+    assert client._client.is_closed
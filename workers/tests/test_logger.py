@@ -0,0 +1,83 @@
+"""Tests for the structured logging setup."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+import structlog
+
+from codeforge import logger as logger_mod
+from codeforge.logger import setup_logging, shutdown_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _reset_logging() -> Iterator[None]:
+    """Restore global logging state after each test."""
+    root = logging.getLogger()
+    level = root.level
+    handlers = root.handlers[:]
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    structlog.reset_defaults()
+
+
+def test_setup_logging_writes_json(capsys: pytest.CaptureFixture[str]) -> None:
+    """Log entries should be written as JSON lines with the service name."""
+    setup_logging(service="test-worker", level="info")
+
+    structlog.get_logger("test").info("hello", task_id="task-1")
+    shutdown_logging()
+
+    entry = json.loads(capsys.readouterr().out.strip())
+    assert entry["event"] == "hello"
+    assert entry["task_id"] == "task-1"
+    assert entry["level"] == "info"
+    assert entry["service"] == "test-worker"
+
+
+def test_setup_logging_filters_by_level(capsys: pytest.CaptureFixture[str]) -> None:
+    """Entries below the configured level should be dropped."""
+    setup_logging(level="warning")
+
+    structlog.get_logger("test").info("hidden")
+    structlog.get_logger("test").warning("shown")
+    shutdown_logging()
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["event"] == "shown"
+
+
+def test_exceptions_stay_on_json_lines(capsys: pytest.CaptureFixture[str]) -> None:
+    """Logged exceptions should be embedded in the JSON entry, not printed as raw tracebacks."""
+    setup_logging()
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        structlog.get_logger("test").exception("structlog failure")
+        logging.getLogger("test.stdlib").exception("stdlib failure")
+    shutdown_logging()
+
+    entries = [json.loads(line) for line in capsys.readouterr().out.strip().splitlines()]
+    assert [entry["event"] for entry in entries] == ["structlog failure", "stdlib failure"]
+    for entry in entries:
+        assert entry["level"] == "error"
+        assert "ValueError: boom" in entry["exception"]
+
+
+def test_shutdown_logging_is_idempotent() -> None:
+    """shutdown_logging should be a no-op when nothing is running."""
+    setup_logging()
+    shutdown_logging()
+    shutdown_logging()
+
+    assert logger_mod._listener is None
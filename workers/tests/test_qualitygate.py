@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from codeforge.consumer import TaskConsumer
 from codeforge.models import QualityGateRequest, QualityGateResult
-from codeforge.qualitygate import QualityGateExecutor
+from codeforge.qualitygate import MIN_MAX_OUTPUT_BYTES, TRUNCATION_MARKER, QualityGateExecutor, _read_bounded
 
 
 @pytest.fixture
@@ -107,6 +108,60 @@ async def test_execute_timeout(executor: QualityGateExecutor) -> None:
     assert "timed out" in result.test_output
 
 
+async def test_execute_output_truncated() -> None:
+    """Execute should keep only the head and tail of very large command output."""
+    small_executor = QualityGateExecutor(timeout_seconds=5, max_output_bytes=1024)
+    request = QualityGateRequest(
+        run_id="run-7",
+        project_id="proj-1",
+        workspace_path="/tmp",
+        run_tests=True,
+        run_lint=False,
+        test_command="echo START; yes x | head -n 100000; echo END",
+    )
+    result = await small_executor.execute(request)
+
+    assert result.tests_passed is True
+    assert result.test_output.startswith("START\n")
+    assert result.test_output.endswith("END\n")
+    assert "output truncated" in result.test_output
+    assert len(result.test_output) < 1024 + 64
+
+
+def _stream(*chunks: bytes) -> asyncio.StreamReader:
+    """Build a StreamReader pre-fed with the given chunks."""
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+@pytest.mark.parametrize("limit", [100, 101])
+async def test_read_bounded_keeps_exact_head_and_tail(limit: int) -> None:
+    """_read_bounded should keep exactly limit bytes, giving the tail the odd byte."""
+    data = bytes(range(256)) * 4
+
+    output = await _read_bounded(_stream(data[:300], data[300:700], data[700:]), limit)
+
+    head, tail = output.split(TRUNCATION_MARKER)
+    assert head == data[: limit // 2]
+    assert tail == data[-(limit - limit // 2) :]
+
+
+async def test_read_bounded_short_output_unchanged() -> None:
+    """_read_bounded should return output within the limit as-is, without a marker."""
+    output = await _read_bounded(_stream(b"abc", b"def"), 6)
+
+    assert output == b"abcdef"
+
+
+def test_max_output_bytes_too_small() -> None:
+    """QualityGateExecutor should reject limits too small to hold a head and tail."""
+    with pytest.raises(ValueError, match="max_output_bytes"):
+        QualityGateExecutor(max_output_bytes=MIN_MAX_OUTPUT_BYTES - 1)
+
+
 async def test_execute_no_commands(executor: QualityGateExecutor) -> None:
     """Execute should skip when neither tests nor lint is requested."""
     request = QualityGateRequest(